@@ -3,10 +3,13 @@
 import os
 import json
 import csv
+import gzip
+import hashlib
 import requests
 from dotenv import load_dotenv
 import aiohttp
 import asyncio
+from dataclasses import dataclass, asdict
 from typing import Dict, List, Optional, Any
 from bs4 import BeautifulSoup
 import PyPDF2
@@ -225,14 +228,54 @@ class DataFetcher:
             return {"source": source, "query": query, "content": ""}
         return {"source": source, "query": query, "content": content}
 
+# Content-addressed blob store
+class BlobStore:
+    """Stores fetched content once, gzip-compressed and keyed by its SHA-256 hash."""
+    def __init__(self, root: str = "datasets/blobs") -> None:
+        self.root = root
+
+    def _path(self, content_hash: str) -> str:
+        return os.path.join(self.root, content_hash[:2], f"{content_hash}.gz")
+
+    def put(self, content: str) -> str:
+        """Writes content if it is not stored yet and returns its hash."""
+        data = content.encode("utf-8")
+        content_hash = hashlib.sha256(data).hexdigest()
+        path = self._path(content_hash)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(gzip.compress(data, mtime=0))
+            os.replace(tmp_path, path)
+        return content_hash
+
+    def get(self, content_hash: str) -> str:
+        with open(self._path(content_hash), "rb") as f:
+            return gzip.decompress(f.read()).decode("utf-8")
+
+# Dataset record class
+@dataclass
+class Record:
+    """A processed task; the fetched content lives in the BlobStore under content_hash."""
+    __slots__ = ("source", "query", "task", "prompt", "content_hash", "result", "processed_by")
+    source: str
+    query: str
+    task: str
+    prompt: str
+    content_hash: str
+    result: Dict[str, Any]
+    processed_by: str
+
 # Dataset builder class
 class DatasetBuilder:
     """Builds and saves datasets from fetched and processed data."""
     def __init__(self, mistral_key: str, youtube_key: str, google_key: str, cse_id: str) -> None:
         self.api_client = APIClient(mistral_key)
         self.data_fetcher = DataFetcher(youtube_key, google_key, cse_id)
+        self.blob_store = BlobStore()
 
-    async def process_task(self, task_info: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    async def process_task(self, task_info: Dict[str, str]) -> Optional[Record]:
         """Processes a single task with data fetching and processing."""
         source = task_info.get("source", "direct")
         query = task_info["query"]
@@ -249,30 +292,37 @@ class DatasetBuilder:
 
         result = await self.api_client.process_text(task, text, prompt)
         if result:
-            return {
-                "source": source,
-                "query": query,
-                "task": task,
-                "prompt": prompt,
-                "content": text,
-                "result": result,
-                "processed_by": "mistral"
-            }
+            return Record(
+                source=source,
+                query=query,
+                task=task,
+                prompt=prompt,
+                content_hash=self.blob_store.put(text),
+                result=result,
+                processed_by="mistral"
+            )
         return None
 
-    def save_dataset(self, data: List[Dict[str, Any]], name: str, output_format: str = "json") -> Optional[str]:
-        """Saves the dataset."""
+    def save_dataset(self, data: List[Record], name: str, output_format: str = "json", inline_content: bool = False) -> Optional[str]:
+        """Saves the dataset. With inline_content, each content_hash is replaced by the stored content."""
         os.makedirs("datasets", exist_ok=True)
         path = f"datasets/{name}.{output_format}"
         try:
+            rows = []
+            for record in data:
+                row = asdict(record)
+                if inline_content:
+                    row["content"] = self.blob_store.get(row.pop("content_hash"))
+                rows.append(row)
+            fieldnames = ["source", "query", "task", "prompt", "content" if inline_content else "content_hash", "result", "processed_by"]
             if output_format == "json":
                 with open(path, "w", encoding="utf-8") as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
+                    json.dump(rows, f, ensure_ascii=False, indent=2)
             elif output_format == "csv":
                 with open(path, "w", encoding="utf-8", newline="") as f:
-                    writer = csv.DictWriter(f, fieldnames=["source", "query", "task", "prompt", "content", "result", "processed_by"])
+                    writer = csv.DictWriter(f, fieldnames=fieldnames)
                     writer.writeheader()
-                    writer.writerows(data)
+                    writer.writerows(rows)
             Display.message("done", f"Saved dataset at {path}")
             return path
         except Exception as e:
@@ -287,7 +337,8 @@ async def run(
     mistral_key: str = "",
     youtube_key: str = "",
     google_key: str = "",
-    cse_id: str = ""
+    cse_id: str = "",
+    inline_content: bool = False
 ) -> Optional[str]:
     """Main function to run the data collection and processing pipeline."""
     if not all([mistral_key]):
@@ -298,7 +349,7 @@ async def run(
     tasks_list = asyncio.gather(*[builder.process_task(task) for task in tasks])
     results = await tasks_list
     dataset = [r for r in results if r]
-    return builder.save_dataset(dataset, name, output_format)
+    return builder.save_dataset(dataset, name, output_format, inline_content)
 
 def get_user_tasks():
     """Get tasks interactively from the user."""